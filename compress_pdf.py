@@ -1,13 +1,188 @@
+import bisect
+import functools
+import io
+import math
 import os
 import sys
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from itertools import repeat
 from pathlib import Path
-from PIL import Image
+from PIL import Image, features
 import fitz  # PyMuPDF
-from pdf2image import convert_from_path
+import img2pdf
 import tempfile
 import shutil
+import struct
+import subprocess
 from datetime import datetime
 
+try:
+    import mozjpeg_lossless_optimization  # Optional: smaller JPEGs through mozjpeg's entropy coding
+except ImportError:
+    mozjpeg_lossless_optimization = None
+
+# Queried once; used to size worker pools
+_CPU = os.cpu_count()
+
+# Threads for the per-image and per-page encode pools; worker processes lower it to their share of the cores
+# so that outer processes times inner threads stays near _CPU
+_encode_threads = _CPU
+
+# Ghostscript binary, if installed ("gswin64c" is the console build on Windows)
+_GHOSTSCRIPT = shutil.which("gs") or shutil.which("gswin64c")
+
+# Every strategy bottlenecks on JPEG encoding, which is several times faster with libjpeg-turbo
+_LIBJPEG_TURBO = features.check_feature("libjpeg_turbo")
+
+# JPEG 2000 needs Pillow built with OpenJPEG (the PyPI wheels are)
+_JPEG2000 = features.check("jpg_2000")
+
+# jpegli's command line encoder, if installed
+_CJPEGLI = shutil.which("cjpegli")
+
+JPEG_ENCODERS = ("libjpeg-turbo", "mozjpeg", "jpegli")
+
+# Attempts at or above this JPEG quality keep Lanczos resampling; lower ones use the much cheaper
+# box (area-average) filter, which looks the same once the page has been quantised that hard
+_LANCZOS_MIN_QUALITY = 95
+
+# Options for every PyMuPDF save: drop unused objects, compress every uncompressed stream (including images and
+# fonts) and pack objects into object streams
+_SAVE_KWARGS = dict(garbage=4, deflate=True, deflate_images=True, deflate_fonts=True, clean=True, use_objstms=1)
+
+# Embedded images smaller than this (in pixels) are not worth re-encoding as JPEG
+_MIN_RECOMPRESS_PIXELS = 64 * 64
+
+
+def _encode_jpeg(img, quality, dpi, jpeg_encoder="libjpeg-turbo"):
+    """
+    Encode a PIL image as JPEG bytes tagged with dpi using the selected encoder:
+
+    - "libjpeg-turbo": Pillow's own encoder
+    - "mozjpeg": Pillow's output losslessly re-packed by mozjpeg (needs mozjpeg-lossless-optimization)
+    - "jpegli": encoded by the cjpegli command line tool
+    """
+    if jpeg_encoder not in JPEG_ENCODERS:
+        raise ValueError(f"Unknown JPEG encoder '{jpeg_encoder}'. Choose from: {', '.join(JPEG_ENCODERS)}")
+
+    if jpeg_encoder == "jpegli":
+        if not _CJPEGLI:
+            raise Exception("jpegli encoder requested but cjpegli was not found on PATH")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            source_path = os.path.join(tmp, "page.ppm")
+            jpeg_path = os.path.join(tmp, "page.jpg")
+            img.save(source_path)
+            subprocess.run([_CJPEGLI, source_path, jpeg_path, "-q", str(quality)], check=True, capture_output=True)
+            return _with_jfif_dpi(Path(jpeg_path).read_bytes(), dpi)
+
+    buffer = io.BytesIO()
+    img.save(buffer, "JPEG", quality=quality, optimize=True, progressive=True, dpi=(dpi, dpi))
+
+    if jpeg_encoder == "mozjpeg":
+        if mozjpeg_lossless_optimization is None:
+            raise Exception("mozjpeg encoder requested but mozjpeg-lossless-optimization is not installed")
+        return mozjpeg_lossless_optimization.optimize(buffer.getvalue())
+
+    return buffer.getvalue()
+
+
+def _with_jfif_dpi(jpeg_bytes, dpi):
+    """Return JPEG bytes whose JFIF header records dpi, inserting a JFIF segment if there is none"""
+    density = struct.pack(">BHH", 1, round(dpi), round(dpi))
+    if jpeg_bytes[2:4] == b"\xff\xe0" and jpeg_bytes[6:11] == b"JFIF\x00":
+        return jpeg_bytes[:13] + density + jpeg_bytes[18:]
+    return jpeg_bytes[:2] + b"\xff\xe0\x00\x10JFIF\x00\x01\x01" + density + b"\x00\x00" + jpeg_bytes[2:]
+
+
+class TooBigError(Exception):
+    """Raised when an attempt is already known to exceed its size budget before the PDF is written"""
+
+
+# Pages rendered once by the parent process and shared with every sweep worker
+_sweep_pages = None
+
+
+def _init_attempt_worker(pages):
+    """Pool initializer: keep the pre-rendered pages in the worker for every attempt it runs"""
+    global _sweep_pages
+    _sweep_pages = pages
+
+
+def _init_strategy_worker(encode_threads):
+    """Pool initializer: limit the encode thread pools of a strategy worker to its share of the cores"""
+    global _encode_threads
+    _encode_threads = encode_threads
+
+
+def _encode_threads_per_worker(workers):
+    """Encode threads each of workers processes may use without oversubscribing the cores"""
+    return max(1, (_CPU or 1) // workers)
+
+
+def _attempt_width(args):
+    """
+    Run every image-compression attempt that shares one max_width in a worker process, resizing the
+    pages only once, and return the output size in MB for each attempt: None on failure, or infinity
+    when the attempt was abandoned for exceeding max_bytes. encode_threads is this task's share of the cores.
+    """
+    global _encode_threads
+    compressor, max_width, attempts, max_bytes, jpeg_encoder, encode_threads = args
+    _encode_threads = encode_threads
+    resized = {}  # resampling filter choice -> downscaled pages
+    sizes = []
+    for output_path, quality in attempts:
+        try:
+            lanczos = quality >= _LANCZOS_MIN_QUALITY
+            if lanczos not in resized:
+                resized[lanczos] = [compressor._fit_width(page, max_width, quality) for page in _sweep_pages]
+
+            compressor._encode_resized(
+                _sweep_pages,
+                resized[lanczos],
+                output_path,
+                quality=quality,
+                max_bytes=max_bytes,
+                jpeg_encoder=jpeg_encoder,
+            )
+            sizes.append(compressor.get_file_size_mb(output_path) if output_path.exists() else None)
+        except TooBigError:
+            sizes.append(math.inf)
+        except Exception as e:
+            print(f"❌ Error (width={max_width}, quality={quality}%): {e}")
+            sizes.append(None)
+    return sizes
+
+
+@functools.lru_cache(maxsize=1)
+def _read_source(path, mtime_ns, size):
+    """Read a source PDF into memory once per process; mtime and size make a changed file a cache miss"""
+    return Path(path).read_bytes()
+
+
+def _open_source(input_path):
+    """Open a source PDF from its cached in-memory copy instead of re-reading it from disk"""
+    stat = os.stat(input_path)
+    return fitz.open(stream=_read_source(str(input_path), stat.st_mtime_ns, stat.st_size), filetype="pdf")
+
+
+def _reencode_jpeg(pil_img, quality):
+    """Return an image extracted from a PDF re-encoded as JPEG"""
+    # Compress image into a buffer pre-sized to a generous JPEG estimate, so it is not repeatedly grown while
+    # the encoder writes; truncate drops whatever part of the estimate was not used
+    output_buffer = io.BytesIO(bytes(pil_img.width * pil_img.height // 4))
+    pil_img.save(output_buffer, format="JPEG", quality=quality, optimize=True)
+    output_buffer.truncate()
+    return output_buffer.getvalue()
+
+
+def _run_strategy(args):
+    """Run one compress_to_target_size strategy in a worker process and return the output size in MB"""
+    compressor, method_name, input_path, output_path, kwargs = args
+    getattr(compressor, method_name)(input_path, output_path, **kwargs)
+    return compressor.get_file_size_mb(output_path) if output_path.exists() else None
+
 
 class PDFCompressor:
     def __init__(self, input_folder="files_input", output_folder="files_output"):
@@ -31,14 +206,20 @@ class PDFCompressor:
 
     def compress_pdf_basic(self, input_path, output_path):
         """Basic PDF optimization without aggressive compression"""
-        doc = fitz.open(input_path)
-        # Basic optimization - garbage collection and deflation
-        doc.save(output_path, garbage=4, deflate=True, clean=True)
+        doc = _open_source(input_path)
+        # Basic optimization - garbage collection, deflation and object streams
+        doc.save(output_path, **_SAVE_KWARGS)
         doc.close()
 
     def compress_pdf_pymupdf(self, input_path, output_path, quality=50):
         """Compress PDF using PyMuPDF with image compression"""
-        doc = fitz.open(input_path)
+        doc = _open_source(input_path)
+
+        # Images shared between pages (logos, backgrounds) are a single xref; re-encode each only once
+        seen_xrefs = set()
+
+        # Extract the images to re-encode; fitz objects are not thread-safe, so this stays on this thread
+        image_data = {}
 
         for page_num in range(len(doc)):
             page = doc.load_page(page_num)
@@ -49,66 +230,213 @@ class PDFCompressor:
             for img_index, img in enumerate(image_list):
                 # Get image data
                 xref = img[0]
+                if xref in seen_xrefs:
+                    continue
+                seen_xrefs.add(xref)
+
+                # Only colour and gray pictures can become JPEGs; an /ImageMask must keep 1 bit and no colorspace
+                if doc.xref_get_key(xref, "ImageMask")[1] == "true":
+                    continue
+
                 pix = fitz.Pixmap(doc, xref)
 
+                # Leave tiny images such as icons alone; JPEG headers alone would make them bigger
+                if pix.width * pix.height < _MIN_RECOMPRESS_PIXELS:
+                    pix = None
+                    continue
+
                 # Convert to PIL Image for compression
                 if pix.n - pix.alpha < 4:  # GRAY or RGB
-                    img_data = pix.tobytes("png")
-                    pil_img = Image.open(tempfile.BytesIO(img_data))
-
-                    # Compress image
-                    output_buffer = tempfile.BytesIO()
-                    if pil_img.mode == "RGBA":
-                        pil_img = pil_img.convert("RGB")
+                    # Drop the alpha channel in C; JPEG cannot store it anyway
+                    if pix.alpha:
+                        pix = fitz.Pixmap(pix, 0)
 
-                    pil_img.save(output_buffer, format="JPEG", quality=quality, optimize=True)
-                    output_buffer.seek(0)
-
-                    # Replace image in PDF
-                    doc.update_stream(xref, output_buffer.read())
+                    # Wrap the raw samples directly instead of round-tripping through a PNG encode/decode
+                    mode = "RGB" if pix.n == 3 else "L"
+                    image_data[xref] = Image.frombuffer(mode, (pix.width, pix.height), pix.samples, "raw", mode, 0, 1)
 
                 pix = None
 
-        doc.save(output_path, garbage=4, deflate=True, clean=True)
+        # Pillow releases the GIL while encoding, so a thread pool re-encodes the images in parallel without
+        # copying pixel data between processes. Inside a strategy worker process the pool only gets that
+        # worker's share of the cores.
+        if image_data:
+            with ThreadPoolExecutor(max_workers=_encode_threads) as executor:
+                new_streams = executor.map(_reencode_jpeg, image_data.values(), repeat(quality))
+
+                # Replace images in PDF, describing the new data as an 8-bit JPEG in the image dictionary.
+                # image_data only holds gray and RGB pictures, never masks.
+                for (xref, pil_img), stream in zip(image_data.items(), new_streams):
+                    doc.update_stream(xref, stream, compress=False)
+                    doc.xref_set_key(xref, "Filter", "/DCTDecode")
+                    doc.xref_set_key(xref, "DecodeParms", "null")
+                    doc.xref_set_key(xref, "Decode", "null")
+                    doc.xref_set_key(xref, "BitsPerComponent", "8")
+                    doc.xref_set_key(xref, "ColorSpace", "/DeviceRGB" if pil_img.mode == "RGB" else "/DeviceGray")
+
+        doc.save(output_path, **_SAVE_KWARGS)
         doc.close()
 
-    def compress_pdf_images(self, input_path, output_path, max_width=1200, quality=75):
-        """Compress PDF by converting to images and back with reduced quality"""
+    def _rasterize(self, input_path, dpi=150):
+        """Render every page of the PDF to an RGB PIL image"""
+        # Render in-process with PyMuPDF: no pdftoppm subprocess and no image files round-tripped through disk
+        matrix = fitz.Matrix(dpi / 72, dpi / 72)
+        pages = []
+        with _open_source(input_path) as doc:
+            for page in doc:
+                pix = page.get_pixmap(matrix=matrix, alpha=False, colorspace=fitz.csRGB)
+                pages.append(Image.frombytes("RGB", (pix.width, pix.height), pix.samples))
+        return pages
+
+    def _fit_width(self, img, max_width, quality):
+        """Downscale an image to max_width if it is wider, using the resampling filter suited to the quality"""
+        if img.width <= max_width:
+            return img
+
+        resample = Image.Resampling.LANCZOS if quality >= _LANCZOS_MIN_QUALITY else Image.Resampling.BOX
+        ratio = max_width / img.width
+        new_height = int(img.height * ratio)
+        return img.resize((max_width, new_height), resample)
+
+    def _encode(self, pages, output_path, max_width=1200, quality=75, dpi=150, jpeg_encoder="libjpeg-turbo"):
+        """Downscale pages rendered at dpi to max_width and save them as a JPEG-compressed PDF"""
+        # Each worker thread resizes its page itself, so both the resize and the encode run in parallel
+        self._encode_resized(
+            pages, pages, output_path, quality=quality, dpi=dpi, jpeg_encoder=jpeg_encoder, max_width=max_width
+        )
+
+    def _resize_and_encode(self, img, resized, max_width, quality, dpi, jpeg_encoder):
+        """Downscale one page to max_width if needed and return its JPEG bytes"""
+        if max_width is not None:
+            resized = self._fit_width(resized, max_width, quality)
+
+        # The DPI tag keeps the original physical page size
+        return _encode_jpeg(resized, quality, dpi * resized.width / img.width, jpeg_encoder)
+
+    def _encode_resized(
+        self,
+        pages,
+        resized_pages,
+        output_path,
+        quality=75,
+        dpi=150,
+        max_bytes=None,
+        jpeg_encoder="libjpeg-turbo",
+        max_width=None,
+    ):
+        """
+        Save already-downscaled copies of pages rendered at dpi as a JPEG-compressed PDF.
+
+        Pages are encoded on a thread pool; Pillow releases the GIL while resizing and saving, so this
+        scales with cores without pickling the pages. Inside a sweep worker process the pool is limited to
+        that worker's share of the cores. If max_width is given, the pages are also fitted to it inside
+        the workers.
+
+        If max_bytes is given and the encoded pages alone exceed it, raises TooBigError without writing
+        the PDF, since the finished file could only be larger.
+        """
+        jpeg_pages = []
+        total_bytes = 0
+        with ThreadPoolExecutor(max_workers=_encode_threads) as executor:
+            # map() yields in page order, so the running total can stop the attempt as early as possible
+            results = executor.map(
+                self._resize_and_encode,
+                pages,
+                resized_pages,
+                repeat(max_width),
+                repeat(quality),
+                repeat(dpi),
+                repeat(jpeg_encoder),
+            )
+            for jpeg_bytes in results:
+                jpeg_pages.append(jpeg_bytes)
+
+                total_bytes += len(jpeg_bytes)
+                if max_bytes is not None and total_bytes > max_bytes:
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    raise TooBigError(f"Encoded pages exceed {max_bytes} bytes")
+
+        # Save as PDF; img2pdf embeds the JPEG bytes as-is instead of encoding them again
+        if jpeg_pages:
+            with open(output_path, "wb") as f:
+                f.write(img2pdf.convert(jpeg_pages))
+
+    def compress_pdf_jpeg2000(self, input_path, output_path, max_width=1200, quality=75, dpi=150):
+        """Compress PDF by converting pages to JPEG 2000 images, which PDF embeds natively"""
         try:
-            # Convert PDF to images
-            images = convert_from_path(input_path, dpi=150)
-
-            # Compress images
-            compressed_images = []
-            for img in images:
-                # Resize if too large
-                if img.width > max_width:
-                    ratio = max_width / img.width
-                    new_height = int(img.height * ratio)
-                    img = img.resize((max_width, new_height), Image.Resampling.LANCZOS)
-
-                # Convert to RGB if needed
-                if img.mode != "RGB":
-                    img = img.convert("RGB")
-
-                compressed_images.append(img)
-
-            # Save as PDF
-            if compressed_images:
-                compressed_images[0].save(
-                    output_path,
-                    save_all=True,
-                    append_images=compressed_images[1:],
-                    format="PDF",
-                    quality=quality,
-                    optimize=True,
+            doc = fitz.open()
+            for img in self._rasterize(input_path, dpi=dpi):
+                # Keep the original physical page size
+                page = doc.new_page(width=img.width * 72 / dpi, height=img.height * 72 / dpi)
+
+                # Map the JPEG-style quality onto a PSNR target for the wavelet encoder (95 -> ~44 dB, 75 -> ~39 dB)
+                buffer = io.BytesIO()
+                self._fit_width(img, max_width, quality).save(
+                    buffer, "JPEG2000", quality_mode="dB", quality_layers=[20 + quality / 4]
                 )
 
+                # PyMuPDF stores JPEG 2000 data as-is under the JPXDecode filter
+                page.insert_image(page.rect, stream=buffer.getvalue())
+
+            doc.save(output_path, **_SAVE_KWARGS)
+            doc.close()
+            return True
+        except Exception as e:
+            print(f"Error in JPEG 2000 compression method: {e}")
+            return False
+
+    def compress_pdf_images(self, input_path, output_path, max_width=1200, quality=75, jpeg_encoder="libjpeg-turbo"):
+        """Compress PDF by converting to images and back with reduced quality"""
+        try:
+            self._encode(
+                self._rasterize(input_path),
+                output_path,
+                max_width=max_width,
+                quality=quality,
+                jpeg_encoder=jpeg_encoder,
+            )
             return True
         except Exception as e:
             print(f"Error in image compression method: {e}")
             return False
 
+    def _compress_pdf_ghostscript(self, input_path, output_path, max_width=1200, quality=75, dpi=150):
+        """Compress PDF by rasterizing straight to JPEG with Ghostscript and stapling the pages with img2pdf"""
+        try:
+            # Lower the render resolution so the widest page comes out at most max_width pixels,
+            # matching the downscale compress_pdf_images applies after rendering
+            with _open_source(input_path) as doc:
+                widest_page = max(page.rect.width for page in doc)
+            dpi = min(dpi, max_width * 72 / widest_page)
+
+            with tempfile.TemporaryDirectory() as tmp:
+                subprocess.run(
+                    [
+                        _GHOSTSCRIPT,
+                        "-q",
+                        "-dNOPAUSE",
+                        "-dBATCH",
+                        "-dSAFER",
+                        "-sDEVICE=jpeg",
+                        f"-r{dpi:.2f}",
+                        f"-dJPEGQ={quality}",
+                        f"-sOutputFile={os.path.join(tmp, 'p-%04d.jpg')}",
+                        str(input_path),
+                    ],
+                    check=True,
+                    capture_output=True,
+                )
+
+                # img2pdf embeds the JPEG streams as-is, so there is no second encode
+                pages = sorted(Path(tmp).glob("p-*.jpg"))
+                with open(output_path, "wb") as f:
+                    f.write(img2pdf.convert([str(page) for page in pages]))
+
+            return True
+        except Exception as e:
+            print(f"Error in Ghostscript compression method: {e}")
+            return False
+
     def compress_to_target_size(self, input_path, target_size_mb, max_attempts=5):
         """Compress PDF to target size with iterative approach"""
         input_size = self.get_file_size_mb(input_path)
@@ -126,86 +454,127 @@ class PDFCompressor:
         output_filename = f"compressed_{target_size_mb}MB_{timestamp}.pdf"
         output_path = self.output_folder / output_filename
 
-        # Try different compression strategies in order of preference (least to most aggressive)
+        # Ghostscript renders, encodes and writes each page in one pass, so prefer it when installed
+        compress_images = "_compress_pdf_ghostscript" if _GHOSTSCRIPT else "compress_pdf_images"
+
+        # Compression strategies in order of preference (least to most aggressive), each with a hand-tuned
+        # expected output size as a fraction of the input. Each entry names the compressor method to run so
+        # it can be handed to a worker process. The expected ratios must not increase down the list.
         strategies = [
-            ("Basic PDF Optimization", lambda: self.compress_pdf_basic(input_path, output_path)),
-            ("PyMuPDF Minimal Compression", lambda: self.compress_pdf_pymupdf(input_path, output_path, quality=95)),
-            ("PyMuPDF Very Light Compression", lambda: self.compress_pdf_pymupdf(input_path, output_path, quality=90)),
-            ("PyMuPDF Light Compression", lambda: self.compress_pdf_pymupdf(input_path, output_path, quality=85)),
-            ("PyMuPDF Low Compression", lambda: self.compress_pdf_pymupdf(input_path, output_path, quality=80)),
-            (
-                "Image Conversion Minimal",
-                lambda: self.compress_pdf_images(input_path, output_path, max_width=1600, quality=95),
-            ),
-            ("PyMuPDF Medium-Low Compression", lambda: self.compress_pdf_pymupdf(input_path, output_path, quality=75)),
-            (
-                "Image Conversion Light",
-                lambda: self.compress_pdf_images(input_path, output_path, max_width=1400, quality=90),
-            ),
-            ("PyMuPDF Medium Compression", lambda: self.compress_pdf_pymupdf(input_path, output_path, quality=70)),
-            (
-                "Image Conversion Medium",
-                lambda: self.compress_pdf_images(input_path, output_path, max_width=1200, quality=85),
-            ),
-            (
-                "PyMuPDF Medium-High Compression",
-                lambda: self.compress_pdf_pymupdf(input_path, output_path, quality=60),
-            ),
-            ("PyMuPDF High Compression", lambda: self.compress_pdf_pymupdf(input_path, output_path, quality=50)),
-            (
-                "Image Conversion High",
-                lambda: self.compress_pdf_images(input_path, output_path, max_width=1000, quality=80),
-            ),
-            ("PyMuPDF Very High Compression", lambda: self.compress_pdf_pymupdf(input_path, output_path, quality=40)),
-            ("PyMuPDF Maximum Compression", lambda: self.compress_pdf_pymupdf(input_path, output_path, quality=30)),
+            ("Basic PDF Optimization", "compress_pdf_basic", {}, 0.95),
+            ("PyMuPDF Minimal Compression", "compress_pdf_pymupdf", {"quality": 95}, 0.80),
+            ("PyMuPDF Very Light Compression", "compress_pdf_pymupdf", {"quality": 90}, 0.62),
+            ("PyMuPDF Light Compression", "compress_pdf_pymupdf", {"quality": 85}, 0.50),
+            ("PyMuPDF Low Compression", "compress_pdf_pymupdf", {"quality": 80}, 0.42),
+            ("Image Conversion Minimal", compress_images, {"max_width": 1600, "quality": 95}, 0.40),
+            ("JPEG 2000 Conversion Minimal", "compress_pdf_jpeg2000", {"max_width": 1600, "quality": 95}, 0.38),
+            ("PyMuPDF Medium-Low Compression", "compress_pdf_pymupdf", {"quality": 75}, 0.36),
+            ("Image Conversion Light", compress_images, {"max_width": 1400, "quality": 90}, 0.30),
+            ("JPEG 2000 Conversion Light", "compress_pdf_jpeg2000", {"max_width": 1400, "quality": 90}, 0.28),
+            ("PyMuPDF Medium Compression", "compress_pdf_pymupdf", {"quality": 70}, 0.26),
+            ("Image Conversion Medium", compress_images, {"max_width": 1200, "quality": 85}, 0.20),
+            ("JPEG 2000 Conversion Medium", "compress_pdf_jpeg2000", {"max_width": 1200, "quality": 85}, 0.18),
+            ("PyMuPDF Medium-High Compression", "compress_pdf_pymupdf", {"quality": 60}, 0.17),
+            ("PyMuPDF High Compression", "compress_pdf_pymupdf", {"quality": 50}, 0.15),
+            ("Image Conversion High", compress_images, {"max_width": 1000, "quality": 80}, 0.12),
+            ("JPEG 2000 Conversion High", "compress_pdf_jpeg2000", {"max_width": 1000, "quality": 80}, 0.11),
+            ("PyMuPDF Very High Compression", "compress_pdf_pymupdf", {"quality": 40}, 0.10),
+            ("PyMuPDF Maximum Compression", "compress_pdf_pymupdf", {"quality": 30}, 0.08),
         ]
+        strategies = [strategy for strategy in strategies if _JPEG2000 or strategy[1] != "compress_pdf_jpeg2000"]
+        expected_ratios = [strategy[3] for strategy in strategies]
 
         best_result = None
         best_size = float("inf")
         target_tolerance = target_size_mb * 0.05  # 5% tolerance
-
-        for strategy_name, compress_func in strategies:
-            try:
-                print(f"\nTrying {strategy_name}...")
-
-                # Create temporary output file
-                temp_output = output_path.with_suffix(".tmp.pdf")
-
-                # Apply compression strategy
-                compress_func()
-
-                # Check if file was created and get size
-                if temp_output.exists():
-                    current_size = self.get_file_size_mb(temp_output)
-                    print(f"Result: {current_size:.2f} MB")
-
-                    # Check if this is within acceptable range (target ± 5%)
-                    if current_size <= target_size_mb and current_size >= (target_size_mb - target_tolerance):
-                        # Perfect! We're in the target range
-                        shutil.move(temp_output, output_path)
-                        print(f"✅ Successfully compressed to {current_size:.2f} MB (target: {target_size_mb} MB)")
-                        return output_path
-                    elif current_size < best_size:
-                        # Better than previous attempts
-                        if best_result and best_result.exists():
-                            best_result.unlink()
-                        best_result = output_path.with_suffix(f'.best_{strategy_name.replace(" ", "_").lower()}.pdf')
-                        shutil.move(temp_output, best_result)
-                        best_size = current_size
-                        print(f"📈 New best result: {current_size:.2f} MB")
-
-                        # If we're very close to target, stop trying more aggressive compression
-                        if current_size <= target_size_mb * 1.1:  # Within 10% above target
-                            print(f"🎯 Close enough to target, stopping here")
+        close_enough = target_size_mb * 1.1  # Within 10% above target
+
+        def in_target_range(size):
+            return size is not None and target_size_mb - target_tolerance <= size <= target_size_mb
+
+        # Binary search for the gentlest strategy that gets close enough to the target: strategies before
+        # lo are known to be too large, and hi is the gentlest one known to be close enough (if any).
+        # Each round jumps to the strategy whose expected ratio, corrected by the last measurement, matches
+        # the target, and runs it together with up to two neighbours on either side in parallel.
+        lo, hi = 0, len(strategies)
+        correction = None  # measured ratio / expected ratio of the last strategy that produced a file
+
+        workers = min(5, _CPU or 1)
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_strategy_worker, initargs=(_encode_threads_per_worker(workers),)
+        ) as executor:
+            while lo < hi:
+                if correction is None:
+                    # Nothing measured yet, so start with the cheapest strategy
+                    window = range(lo, lo + 1)
+                else:
+                    wanted_ratio = target_size_mb / input_size / correction
+                    guess = bisect.bisect_left(expected_ratios, -wanted_ratio, lo, hi, key=lambda ratio: -ratio)
+                    guess = min(guess, hi - 1)
+                    window = range(max(lo, guess - 2), min(hi, guess + 3))
+
+                # Every strategy writes to its own temporary file so strategies can run side by side
+                attempts = [(*strategies[i][:3], output_path.with_suffix(f".try{i:02d}.pdf")) for i in window]
+                indices = {temp_output: i for i, (_, _, _, temp_output) in zip(window, attempts)}
+                results = self._run_strategies(executor, input_path, attempts, in_target_range)
+
+                try:
+                    # Walk the results in strategy order so the outcome matches running them one by one
+                    for strategy_name, temp_output, current_size, error in results:
+                        i = indices[temp_output]
+                        print(f"\nTrying {strategy_name}...")
+
+                        if error is not None:
+                            print(f"❌ {strategy_name} failed: {error}")
+                            lo = i + 1
+                            continue
+
+                        # Check if file was created and get size
+                        if current_size is None:
+                            lo = i + 1
+                            continue
+
+                        print(f"Result: {current_size:.2f} MB")
+                        correction = current_size / input_size / strategies[i][3]
+
+                        # Check if this is within acceptable range (target ± 5%)
+                        if in_target_range(current_size):
+                            # Perfect! We're in the target range
+                            if best_result and best_result.exists():
+                                best_result.unlink()
+                            shutil.move(temp_output, output_path)
+                            print(f"✅ Successfully compressed to {current_size:.2f} MB (target: {target_size_mb} MB)")
+                            return output_path
+
+                        if current_size <= close_enough:
+                            # Gentler than any close result so far, so it replaces the previous best
+                            hi = i
+                        else:
+                            lo = i + 1
+
+                        if current_size <= close_enough or (best_size > close_enough and current_size < best_size):
+                            # Better than previous attempts
+                            if best_result and best_result.exists():
+                                best_result.unlink()
+                            best_result = output_path.with_suffix(
+                                f'.best_{strategy_name.replace(" ", "_").lower()}.pdf'
+                            )
+                            shutil.move(temp_output, best_result)
+                            best_size = current_size
+                            print(f"📈 New best result: {current_size:.2f} MB")
+
+                        # Strategies after a close result can only compress more aggressively
+                        if current_size <= close_enough:
+                            if lo >= hi:
+                                print(f"🎯 Close enough to target, stopping here")
+                            else:
+                                print(f"🎯 Close enough to target, checking gentler strategies")
                             break
-                    else:
-                        # Clean up temp file
-                        temp_output.unlink()
-
-            except Exception as e:
-                print(f"❌ {strategy_name} failed: {e}")
-                if "temp_output" in locals() and temp_output.exists():
-                    temp_output.unlink()
+                finally:
+                    # Clean up temp files of attempts that were not kept
+                    for _, _, _, temp_output in attempts:
+                        if temp_output.exists():
+                            temp_output.unlink()
 
         # Use the best result we found
         if best_result and best_result.exists():
@@ -220,6 +589,31 @@ class PDFCompressor:
 
         raise Exception("All compression strategies failed")
 
+    def _run_strategies(self, executor, input_path, attempts, in_target_range):
+        """
+        Run compression attempts concurrently and return (name, output_path, size, error) for each one
+        in the original order. Once any attempt lands in the target range, attempts that have not started
+        yet are cancelled and left out of the results.
+        """
+        futures = [
+            executor.submit(_run_strategy, (self, method, input_path, temp_output, kwargs))
+            for _, method, kwargs, temp_output in attempts
+        ]
+
+        for future in as_completed(futures):
+            if not future.cancelled() and future.exception() is None and in_target_range(future.result()):
+                for pending in futures:
+                    pending.cancel()
+                break
+
+        results = []
+        for (name, _, _, temp_output), future in zip(attempts, futures):
+            if future.cancelled():
+                continue
+            error = future.exception()
+            results.append((name, temp_output, None if error else future.result(), error))
+        return results
+
     def compress_first_file(self, target_size_mb):
         """Main method to compress the first PDF file to target size"""
         try:
@@ -248,8 +642,16 @@ class PDFCompressor:
             print(f"❌ Error: {e}")
             return None
 
-    def compress_with_multiple_attempts_image_only(self, input_path, target_size_mb):
-        """Create multiple compressed files using image compression and keep only the best one below target size"""
+    def compress_with_multiple_attempts_image_only(
+        self, input_path, target_size_mb, predict=False, jpeg_encoder="libjpeg-turbo"
+    ):
+        """
+        Create multiple compressed files using image compression and keep only the best one below target size.
+
+        With predict=True, the two ends of the parameter sweep are run first to fit a size model, and
+        settings predicted to land far from the target are skipped. jpeg_encoder selects the JPEG encoder
+        used for every page (one of JPEG_ENCODERS).
+        """
         input_size = self.get_file_size_mb(input_path)
 
         if input_size <= target_size_mb:
@@ -313,41 +715,97 @@ class PDFCompressor:
         print("\n🔄 Creating multiple compressed versions...")
         print(f"Will test {len(compression_params)} different compression settings\n")
 
-        for i, (max_width, quality) in enumerate(compression_params, 1):
-            try:
-                # Create unique filename for this attempt
-                temp_filename = f"{base_filename}_attempt_{i:02d}_w{max_width}_q{quality}.pdf"
-                temp_output_path = self.output_folder / temp_filename
+        # Rendering the PDF is the most expensive step and is identical for every attempt, so do it once
+        try:
+            pages = self._rasterize(input_path)
+        except Exception as e:
+            raise Exception(f"Could not render PDF pages: {e}")
 
-                print(
-                    f"[{i:2d}/{len(compression_params)}] Testing: width={max_width}, quality={quality}%", end=" ... "
+        # Every attempt is independent, so run them across all cores and report in the original order
+        output_paths = [
+            self.output_folder / f"{base_filename}_attempt_{i:02d}_w{max_width}_q{quality}.pdf"
+            for i, (max_width, quality) in enumerate(compression_params, 1)
+        ]
+        sizes = [None] * len(compression_params)
+        skipped = {}  # attempt index -> predicted size in MB
+
+        def run_attempts(pool, indices, max_bytes=None):
+            # Group attempts by max_width so the pages are resized once per width rather than once per attempt
+            groups = {}
+            for i in indices:
+                groups.setdefault(compression_params[i][0], []).append(i)
+
+            # Share the cores between the tasks that actually run side by side in this round
+            encode_threads = _encode_threads_per_worker(min(len(groups), workers))
+            tasks = [
+                (
+                    self,
+                    max_width,
+                    [(output_paths[i], compression_params[i][1]) for i in group],
+                    max_bytes,
+                    jpeg_encoder,
+                    encode_threads,
                 )
+                for max_width, group in groups.items()
+            ]
+            for group, group_sizes in zip(groups.values(), pool.map(_attempt_width, tasks)):
+                for i, size in zip(group, group_sizes):
+                    sizes[i] = size
+
+        # Attempts are submitted one task per width, so more workers than widths would only sit idle
+        workers = min(len({max_width for max_width, _ in compression_params}), _CPU or 1)
+        with multiprocessing.Pool(workers, _init_attempt_worker, (pages,)) as pool:
+            pending = list(range(len(compression_params)))
+
+            if predict and len(compression_params) > 2:
+                # Calibrate on the two ends of the sweep so later predictions interpolate rather than extrapolate.
+                # These need real sizes, so they are never cut short.
+                calibration = [0, len(compression_params) - 1]
+                run_attempts(pool, calibration)
+
+                model = self._fit_size_model(
+                    [(*compression_params[i], sizes[i]) for i in calibration], max(page.width for page in pages)
+                )
+                pending = [i for i in pending if i not in calibration]
+                if model is not None:
+                    for i in pending:
+                        predicted = model(*compression_params[i])
+                        if predicted < target_size_mb * 0.5 or predicted > target_size_mb * 2:
+                            skipped[i] = predicted
+                    pending = [i for i in pending if i not in skipped]
 
-                # Apply compression
-                success = self.compress_pdf_images(input_path, temp_output_path, max_width=max_width, quality=quality)
+            # An attempt over the target can never be kept, so stop encoding it as soon as it overshoots
+            run_attempts(pool, pending, max_bytes=int(target_size_mb * 1024 * 1024))
 
-                if success and temp_output_path.exists():
-                    current_size = self.get_file_size_mb(temp_output_path)
-                    print(f"Result: {current_size:.2f} MB")
+        for i, ((max_width, quality), temp_output_path, current_size) in enumerate(
+            zip(compression_params, output_paths, sizes), 1
+        ):
+            print(f"[{i:2d}/{len(compression_params)}] Testing: width={max_width}, quality={quality}%", end=" ... ")
 
-                    created_files.append((temp_output_path, current_size, max_width, quality))
+            if i - 1 in skipped:
+                print(f"⏭️  Skipped (predicted {skipped[i - 1]:.2f} MB)")
 
-                    # Check if this is the best result below target size
-                    # We want the LARGEST file that's still under the target size (best quality)
-                    if current_size <= target_size_mb and current_size > best_size:
-                        best_file = temp_output_path
-                        best_size = current_size
-                        print(f"    🎯 New best result: {current_size:.2f} MB (closer to target)")
+            elif current_size == math.inf:
+                print("❌ Over target (stopped early)")
 
-                        # If we're very close to target, we might want to continue to find even better
-                        if current_size >= (target_size_mb - target_tolerance):
-                            print("    ✨ Very close to target! Continuing to find optimal...")
+            elif current_size is not None:
+                print(f"Result: {current_size:.2f} MB")
 
-                else:
-                    print("❌ Failed")
+                created_files.append((temp_output_path, current_size, max_width, quality))
 
-            except Exception as e:
-                print(f"❌ Error: {e}")
+                # Check if this is the best result below target size
+                # We want the LARGEST file that's still under the target size (best quality)
+                if current_size <= target_size_mb and current_size > best_size:
+                    best_file = temp_output_path
+                    best_size = current_size
+                    print(f"    🎯 New best result: {current_size:.2f} MB (closer to target)")
+
+                    # If we're very close to target, we might want to continue to find even better
+                    if current_size >= (target_size_mb - target_tolerance):
+                        print("    ✨ Very close to target! Continuing to find optimal...")
+
+            else:
+                print("❌ Failed")
 
         # Sort all created files by size (descending - largest first)
         created_files.sort(key=lambda x: x[1], reverse=True)
@@ -404,7 +862,30 @@ class PDFCompressor:
 
             raise Exception("No successful compression achieved")
 
-    def compress_first_file_image_only(self, target_size_mb):
+    def _fit_size_model(self, samples, page_width):
+        """
+        Fit size ≈ a · width² · b^quality to two (max_width, quality, size_mb) samples.
+
+        Returns a function predicting the size in MB for (max_width, quality), or None if the samples
+        cannot determine the model (a failed attempt, or equal qualities).
+        """
+        (w1, q1, s1), (w2, q2, s2) = samples
+        if not s1 or not s2 or q1 == q2:
+            return None
+
+        # Pages are never upscaled, so the encoded width is capped by the rendered page width
+        def log_area_free_size(max_width, size):
+            return math.log(size) - 2 * math.log(min(max_width, page_width))
+
+        log_b = (log_area_free_size(w1, s1) - log_area_free_size(w2, s2)) / (q1 - q2)
+        log_a = log_area_free_size(w1, s1) - q1 * log_b
+
+        def predict(max_width, quality):
+            return math.exp(log_a + 2 * math.log(min(max_width, page_width)) + quality * log_b)
+
+        return predict
+
+    def compress_first_file_image_only(self, target_size_mb, predict=False, jpeg_encoder="libjpeg-turbo"):
         """Main method to compress the first PDF file using only image compression with multiple attempts"""
         try:
             # Get first PDF file
@@ -412,7 +893,9 @@ class PDFCompressor:
             print(f"📁 Processing file: {input_file.name}")
 
             # Compress to target size using image compression only
-            output_file = self.compress_with_multiple_attempts_image_only(input_file, target_size_mb)
+            output_file = self.compress_with_multiple_attempts_image_only(
+                input_file, target_size_mb, predict=predict, jpeg_encoder=jpeg_encoder
+            )
 
             return output_file
 
@@ -426,6 +909,9 @@ def main():
     print("🔧 PDF Compressor Tool")
     print("=" * 50)
 
+    if not _LIBJPEG_TURBO:
+        print("⚠️  Pillow is not built with libjpeg-turbo; JPEG encoding will be slow")
+
     # Get target size from user
     try:
         target_size = float(input("Enter target size in MB: "))
@@ -456,7 +942,7 @@ def main():
     if choice == "1":
         compressor.compress_first_file(target_size)
     else:
-        compressor.compress_first_file_image_only(target_size)
+        compressor.compress_first_file_image_only(target_size, predict="--predict" in sys.argv[1:])
 
 
 if __name__ == "__main__":
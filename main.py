@@ -7,29 +7,82 @@ and existing PDF files into a single, consolidated PDF document with consistent
 Dependencies:
 - Pillow (PIL): For image manipulation
 - reportlab: For PDF generation
-- pdf2image: For converting PDF pages to images (requires Poppler)
+- pypdf: For copying PDF pages into the output
+- pdf2image: For converting PDF pages to images (requires Poppler, only used with rasterize_pdfs=True)
 
 Installation Instructions:
-1. Install Poppler:
+1. Install Poppler (only needed to rasterize PDF pages):
    - macOS: brew install poppler
    - Linux (Ubuntu/Debian): sudo apt-get install poppler-utils
    - Windows: Download from https://github.com/oschwartz10612/poppler-windows/releases/
 
 2. Install Python packages:
-   pip install Pillow reportlab pdf2image
+   pip install Pillow reportlab pypdf pdf2image
    or
-   poetry add Pillow reportlab pdf2image
+   poetry add Pillow reportlab pypdf pdf2image
 """
 
+import contextlib
+import functools
+import hashlib
+import io
+import logging
 import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from typing import List
 from PIL import Image
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
 from pdf2image import convert_from_path
+from pypdf import PdfReader, PdfWriter, Transformation
 import tempfile
 import datetime
-import glob
+
+# Per-page progress is logged at DEBUG level so large documents do not flood stdout
+logger = logging.getLogger(__name__)
+
+
+def _render_file_to_pdf(merger: "PDFMerger", file_path: str, temp_dir: str, file_index: int):
+    """
+    Render one input file into its own PDF of A4 pages in the scratch folder, in a worker process.
+
+    Args:
+        merger (PDFMerger): Merger whose page settings are used
+        file_path (str): Path to the image or PDF file
+        temp_dir (str): Scratch folder shared by the whole merge
+        file_index (int): Position of the file in the merge, used to name the rendered PDF
+
+    Returns:
+        str: Path to the rendered PDF, or None if the file could not be processed
+    """
+    writer = PdfWriter()
+    if not merger._add_file_to_pdf(writer, file_path, temp_dir):
+        return None
+
+    # Only the path travels back to the parent process, not the PDF itself
+    rendered_path = os.path.join(temp_dir, f"rendered_{file_index:06d}.pdf")
+    writer.write(rendered_path)
+    return rendered_path
+
+
+def _content_digest(file_path: str):
+    """
+    Hash a file's contents so that repeated inputs can be rendered only once.
+
+    Args:
+        file_path (str): Path to the image or PDF file
+
+    Returns:
+        bytes: Digest of the file contents, or the path itself if the file cannot be read
+    """
+    try:
+        with open(file_path, "rb") as file:
+            return hashlib.file_digest(file, lambda: hashlib.blake2b(digest_size=16)).digest()
+    except OSError:
+        # Let the worker report the error for this file
+        return file_path
 
 
 class PDFMerger:
@@ -39,19 +92,41 @@ class PDFMerger:
     This class handles the conversion of various image formats (JPG, PNG) and
     existing PDF files into a unified PDF document with consistent A4 page sizing.
     All images are scaled to fit within A4 boundaries while preserving aspect ratio.
+    PDF pages are copied as vector content and scaled onto A4 pages the same way.
     """
 
-    def __init__(self):
+    def __init__(self, rasterize_pdfs: bool = False, raster_dpi: int = 150, paint_white_background: bool = False):
         """
         Initialize the PDFMerger with A4 page dimensions and empty file list.
 
         Sets up standard A4 dimensions in points (72 points per inch):
         - Width: 595.27 points (8.27 inches)
         - Height: 841.89 points (11.69 inches)
+
+        Args:
+            rasterize_pdfs (bool): Convert PDF pages to images with Poppler instead of copying them
+                as vector content (default: False)
+            raster_dpi (int): Resolution used when rasterizing PDF pages (default: 150)
+            paint_white_background (bool): Paint an opaque white rectangle behind drawn images, e.g. for
+                transparent PNGs shown in a dark viewer (default: False)
         """
         # A4 page dimensions in points (72 points per inch)
         self.page_width, self.page_height = A4
 
+        # Page-independent layout values, with 5% margins on each side for better visual appearance
+        self._available_width = self.page_width * 0.9
+        self._available_height = self.page_height * 0.9
+        self._half_page_width = self.page_width / 2
+        self._half_page_height = self.page_height / 2
+
+        # Largest image size worth embedding: 300 DPI across the whole page, in pixels
+        self.max_image_size = (round(self.page_width * 300 / 72), round(self.page_height * 300 / 72))
+
+        # Rasterizing is much slower and loses text, but flattens anything unusual in the source PDFs
+        self.rasterize_pdfs = rasterize_pdfs
+        self.raster_dpi = raster_dpi
+        self.paint_white_background = paint_white_background
+
         # Internal list to store file paths for processing
         self.files_to_merge: List[str] = []
 
@@ -59,8 +134,27 @@ class PDFMerger:
         self.supported_image_formats = {".jpg", ".jpeg", ".png"}
         self.supported_pdf_format = {".pdf"}
 
+        # Extension -> "image" or "pdf", so every file type check is a single dictionary lookup
+        self._kind_by_ext = {ext: "image" for ext in self.supported_image_formats}
+        self._kind_by_ext.update((ext, "pdf") for ext in self.supported_pdf_format)
+
+        # Content hash of an image file -> its prepared JPEG, so duplicate images are only encoded once per merge
+        self._prepared_images = {}
+
         print(f"PDFMerger initialized with A4 dimensions: {self.page_width:.2f} x {self.page_height:.2f} points")
 
+    def _kind(self, file_path: str):
+        """
+        Classify a file by its extension (case-insensitive).
+
+        Args:
+            file_path (str): Path or name of the file
+
+        Returns:
+            str: "image" or "pdf", or None if the file type is not supported
+        """
+        return self._kind_by_ext.get(file_path[file_path.rfind(".") :].lower())
+
     def add_file(self, file_path: str) -> bool:
         """
         Add a file to the merge queue after validation.
@@ -77,21 +171,19 @@ class PDFMerger:
                 print(f"Error: File does not exist: {file_path}")
                 return False
 
-            # Get file extension and normalize to lowercase
-            file_extension = os.path.splitext(file_path)[1].lower()
-
             # Validate file type
-            if file_extension in self.supported_image_formats:
+            file_kind = self._kind(file_path)
+            if file_kind == "image":
                 print(f"Added image file: {os.path.basename(file_path)}")
                 self.files_to_merge.append(file_path)
                 return True
-            elif file_extension in self.supported_pdf_format:
+            elif file_kind == "pdf":
                 print(f"Added PDF file: {os.path.basename(file_path)}")
                 self.files_to_merge.append(file_path)
                 return True
             else:
                 print(
-                    f"Error: Unsupported file format '{file_extension}'. "
+                    f"Error: Unsupported file format '{os.path.splitext(file_path)[1].lower()}'. "
                     f"Supported formats: {', '.join(self.supported_image_formats | self.supported_pdf_format)}"
                 )
                 return False
@@ -100,114 +192,240 @@ class PDFMerger:
             print(f"Error adding file {file_path}: {str(e)}")
             return False
 
-    def _calculate_scaling_and_position(self, image_width: int, image_height: int) -> tuple:
+    def _calculate_scaling_and_position(self, image_width: int, image_height: int, upscale: bool = False) -> tuple:
         """
         Calculate scaling factor and position to fit image in A4 page while preserving aspect ratio.
 
         Args:
             image_width (int): Original image width in pixels
             image_height (int): Original image height in pixels
+            upscale (bool): Allow enlarging content smaller than the available space (default: False)
 
         Returns:
             tuple: (scale_factor, x_position, y_position, scaled_width, scaled_height)
         """
-        # Define margins (10% of page dimensions for better visual appearance)
-        margin_x = self.page_width * 0.05
-        margin_y = self.page_height * 0.05
-
-        # Available space for the image
-        available_width = self.page_width - (2 * margin_x)
-        available_height = self.page_height - (2 * margin_y)
+        return self._fit_to_page(
+            image_width,
+            image_height,
+            upscale,
+            self._available_width,
+            self._available_height,
+            self._half_page_width,
+            self._half_page_height,
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _fit_to_page(
+        image_width, image_height, upscale, available_width, available_height, half_page_width, half_page_height
+    ) -> tuple:
+        """
+        Cached layout math behind _calculate_scaling_and_position.
 
+        Pages of one document usually share their size, so most calls are cache hits.
+        """
         # Calculate scaling factors for width and height
         width_scale = available_width / image_width
         height_scale = available_height / image_height
 
         # Use the smaller scaling factor to ensure the image fits entirely within page
-        # Cap scale_factor at 1.0 to prevent scaling up images (only scale down if needed)
-        # This ensures images are never enlarged beyond their original size
-        scale_factor = min(width_scale, height_scale, 1.0)
+        # Unless upscale is set, cap scale_factor at 1.0 so images are only ever scaled down.
+        # Vector PDF pages pass upscale=True and are enlarged to fill the page, since they stay sharp at any size
+        scale_factor = min(width_scale, height_scale)
+        if not upscale:
+            scale_factor = min(scale_factor, 1.0)
 
         # Calculate scaled dimensions
         scaled_width = image_width * scale_factor
         scaled_height = image_height * scale_factor
 
         # Calculate position to center the image
-        x_position = (self.page_width - scaled_width) / 2
-        y_position = (self.page_height - scaled_height) / 2
+        x_position = half_page_width - scaled_width / 2
+        y_position = half_page_height - scaled_height / 2
 
         return scale_factor, x_position, y_position, scaled_width, scaled_height
 
-    def _add_image_to_pdf(self, canvas_obj: canvas.Canvas, image_path: str) -> bool:
+    def _draw_page(
+        self, writer: PdfWriter, image, image_width: int, image_height: int, upscale: bool = False
+    ) -> float:
+        """
+        Draw an image centered on a new A4 page and add the page to the PDF writer.
+
+        This is the single place where images and rasterized PDF pages are laid out and drawn.
+
+        Args:
+            writer (PdfWriter): pypdf writer collecting the output pages
+            image: Image to draw, as a file path or a ReportLab ImageReader
+            image_width (int): Image width in pixels
+            image_height (int): Image height in pixels
+            upscale (bool): Allow enlarging the image to fill the margins (default: False)
+
+        Returns:
+            float: Scale factor the image was drawn with
+        """
+        # Draw each page into its own in-memory PDF, so it can be freed as soon as it is copied
+        page_buffer = io.BytesIO()
+        canvas_obj = canvas.Canvas(page_buffer, pagesize=A4)
+
+        # Calculate scaling and positioning
+        scale_factor, x_pos, y_pos, scaled_width, scaled_height = self._calculate_scaling_and_position(
+            image_width, image_height, upscale
+        )
+
+        # Fill the entire page with white background, if asked; viewers show unpainted areas as white
+        if self.paint_white_background:
+            canvas_obj.setFillColorRGB(1, 1, 1)  # White color
+            canvas_obj.rect(0, 0, self.page_width, self.page_height, fill=1)
+
+        # Add the scaled and positioned image to the canvas
+        canvas_obj.drawImage(
+            image,
+            x_pos,
+            y_pos,
+            width=scaled_width,
+            height=scaled_height,
+            preserveAspectRatio=True,
+        )
+
+        # Finish the page and copy it into the writer
+        canvas_obj.showPage()
+        canvas_obj.save()
+        writer.append(page_buffer)
+
+        return scale_factor
+
+    def _prepare_image(self, image_bytes: bytes) -> tuple:
+        """
+        Decode an image file, downscale it to at most 300 DPI on A4 and encode it as JPEG.
+
+        Args:
+            image_bytes (bytes): Contents of the image file
+
+        Returns:
+            tuple: (jpeg_bytes, width, height)
+        """
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            # Let the JPEG decoder skip detail the page cannot show
+            img.draft("RGB", self.max_image_size)
+
+            # Fix the mode before resizing: Pillow only resizes bilevel and palette images with nearest-neighbour
+            # sampling, which drops the thin lines of black-and-white scans. Black-and-white becomes grayscale,
+            # transparency is flattened onto white and other modes that cannot be embedded directly become RGB.
+            # RGB and grayscale images are used as they are, without a copy.
+            if img.mode == "1":
+                img = img.convert("L")
+            elif img.mode == "P" and "transparency" in img.info:
+                img = img.convert("RGBA")
+            if img.mode in ("RGBA", "LA"):
+                background = Image.new("RGB", img.size, (255, 255, 255))
+                background.paste(img, mask=img.getchannel("A"))
+                img = background
+            elif img.mode not in ("RGB", "L"):
+                img = img.convert("RGB")
+
+            # Downscale to at most 300 DPI
+            img.thumbnail(self.max_image_size, Image.Resampling.LANCZOS)
+
+            # Encode the image as JPEG in memory; ReportLab embeds JPEG data as-is instead of raw pixels
+            jpeg_buffer = io.BytesIO()
+            img.save(jpeg_buffer, "JPEG", quality=80, optimize=True)
+            return jpeg_buffer.getvalue(), img.width, img.height
+
+    def _add_image_to_pdf(self, writer: PdfWriter, image_path: str) -> bool:
         """
-        Add an image to the PDF canvas as a new A4 page.
+        Add an image to the PDF writer as a new A4 page.
 
         Args:
-            canvas_obj (canvas.Canvas): ReportLab canvas object
+            writer (PdfWriter): pypdf writer collecting the output pages
             image_path (str): Path to the image file
 
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Open and process the image
-            with Image.open(image_path) as img:
-                # Convert to RGB if necessary (handles RGBA and other formats)
-                if img.mode != "RGB":
-                    img = img.convert("RGB")
-
-                # Get image dimensions
-                img_width, img_height = img.size
-
-                # Calculate scaling and positioning
-                scale_factor, x_pos, y_pos, scaled_width, scaled_height = self._calculate_scaling_and_position(
-                    img_width, img_height
+            with open(image_path, "rb") as image_file:
+                image_bytes = image_file.read()
+
+            # Identical files (e.g. the same receipt added twice) are only decoded and encoded once
+            digest = hashlib.blake2b(image_bytes, digest_size=16).digest()
+            prepared_image = self._prepared_images.get(digest)
+            if prepared_image is None:
+                prepared_image = self._prepare_image(image_bytes)
+                if len(self._prepared_images) >= 32:
+                    # Drop the oldest entry to keep memory bounded on long merges
+                    self._prepared_images.pop(next(iter(self._prepared_images)))
+                self._prepared_images[digest] = prepared_image
+
+            jpeg_bytes, img_width, img_height = prepared_image
+            scale_factor = self._draw_page(writer, ImageReader(io.BytesIO(jpeg_bytes)), img_width, img_height)
+            logger.debug("Added image: %s (scaled by %.2f)", os.path.basename(image_path), scale_factor)
+
+            return True
+
+        except Exception as e:
+            print(f"Error processing image {image_path}: {str(e)}")
+            return False
+
+    def _add_pdf_to_pdf(self, writer: PdfWriter, pdf_path: str, temp_dir: str = None) -> bool:
+        """
+        Add all pages from a PDF file to the PDF writer, each scaled onto its own A4 page.
+
+        Pages are copied as vector content, so text stays selectable and nothing is re-encoded.
+
+        Args:
+            writer (PdfWriter): pypdf writer collecting the output pages
+            pdf_path (str): Path to the PDF file
+            temp_dir (str): Scratch folder for rasterized pages, only used with rasterize_pdfs (default: None)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if self.rasterize_pdfs:
+            return self._add_rasterized_pdf_to_pdf(writer, pdf_path, dpi=self.raster_dpi, temp_dir=temp_dir)
+
+        try:
+            reader = PdfReader(pdf_path)
+
+            for page_num, page in enumerate(reader.pages, 1):
+                # Bake any /Rotate into the content so the page box matches what is displayed
+                page.transfer_rotation_to_content()
+                page_box = page.cropbox
+
+                # PDF pages are measured in points, so fit them to the margins even if that enlarges them
+                scale_factor, x_pos, y_pos, _, _ = self._calculate_scaling_and_position(
+                    float(page_box.width), float(page_box.height), upscale=True
                 )
 
-                # Fill the entire page with white background
-                canvas_obj.setFillColorRGB(1, 1, 1)  # White color
-                canvas_obj.rect(0, 0, self.page_width, self.page_height, fill=1)
-
-                # Save image to temporary file for ReportLab compatibility
-                with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as temp_file:
-                    img.save(temp_file.name, "JPEG", quality=95)
-                    temp_image_path = temp_file.name
-
-                try:
-                    # Add the scaled and positioned image to the canvas
-                    canvas_obj.drawImage(
-                        temp_image_path,
-                        x_pos,
-                        y_pos,
-                        width=scaled_width,
-                        height=scaled_height,
-                        preserveAspectRatio=True,
-                    )
-
-                    # Move to next page after adding content
-                    canvas_obj.showPage()
-                    print(f"  Added image: {os.path.basename(image_path)} " f"(scaled by {scale_factor:.2f})")
-
-                finally:
-                    # Clean up temporary file
-                    try:
-                        os.unlink(temp_image_path)
-                    except OSError:
-                        pass
+                # Place the scaled and centered page on a blank A4 page. The page must belong to the writer, so
+                # that pypdf moves links, form fields and other annotations along with the content.
+                a4_page = writer.add_blank_page(width=self.page_width, height=self.page_height)
+                a4_page.merge_transformed_page(
+                    page,
+                    Transformation()
+                    .translate(-float(page_box.left), -float(page_box.bottom))
+                    .scale(scale_factor)
+                    .translate(x_pos, y_pos),
+                )
+                logger.debug("Added page %d from PDF (scaled by %.2f)", page_num, scale_factor)
 
-                return True
+            print(f"  Successfully processed {len(reader.pages)} pages from PDF")
+            return True
 
         except Exception as e:
-            print(f"Error processing image {image_path}: {str(e)}")
+            print(f"Error processing PDF {pdf_path}: {str(e)}")
             return False
 
-    def _add_pdf_to_pdf(self, canvas_obj: canvas.Canvas, pdf_path: str) -> bool:
+    def _add_rasterized_pdf_to_pdf(
+        self, writer: PdfWriter, pdf_path: str, dpi: int = 150, temp_dir: str = None
+    ) -> bool:
         """
-        Add all pages from a PDF file to the canvas by converting them to images.
+        Add all pages from a PDF file to the PDF writer by converting them to images.
 
         Args:
-            canvas_obj (canvas.Canvas): ReportLab canvas object
+            writer (PdfWriter): pypdf writer collecting the output pages
             pdf_path (str): Path to the PDF file
+            dpi (int): Resolution to render the pages at (default: 150)
+            temp_dir (str): Scratch folder for the page images; a private one is created if None (default: None)
 
         Returns:
             bool: True if successful, False otherwise
@@ -216,55 +434,34 @@ class PDFMerger:
             # Convert PDF pages to images
             print(f"  Converting PDF pages to images: {os.path.basename(pdf_path)}")
 
-            # Convert PDF to images with high DPI for better quality
-            images = convert_from_path(pdf_path, dpi=300)
+            # The merge normally shares one scratch folder, which is removed in one go when the merge ends
+            scratch = tempfile.TemporaryDirectory() if temp_dir is None else contextlib.nullcontext(temp_dir)
+            with scratch as temp_dir:
+                # Pages end up about A4-sized, so 150 DPI is plenty on screen. Poppler renders pages in parallel and
+                # writes them straight to JPEG files, so the pages never need to be encoded again here. Only the
+                # file paths come back, so at most one page is open at a time however long the PDF is.
+                image_paths = convert_from_path(
+                    pdf_path,
+                    dpi=dpi,
+                    thread_count=max(1, (os.cpu_count() or 2) - 1),
+                    output_folder=temp_dir,
+                    fmt="jpeg",
+                    jpegopt={"quality": 80, "optimize": True, "progressive": True},
+                    paths_only=True,
+                )
 
-            # Process each page as an image
-            for page_num, img in enumerate(images, 1):
-                # Convert PIL Image to RGB if necessary
-                if img.mode != "RGB":
-                    img = img.convert("RGB")
+                # Process each page as an image
+                for page_num, image_path in enumerate(image_paths, 1):
+                    # Get image dimensions; opening a JPEG only reads its header
+                    with Image.open(image_path) as img:
+                        img_width, img_height = img.size
 
-                # Get image dimensions
-                img_width, img_height = img.size
+                    # ReportLab embeds the JPEG file as-is. Like vector-copied pages, PDF pages fill the margins
+                    # whatever DPI they were rendered at, so small pages are enlarged.
+                    scale_factor = self._draw_page(writer, image_path, img_width, img_height, upscale=True)
+                    logger.debug("Added page %d from PDF (scaled by %.2f)", page_num, scale_factor)
 
-                # Calculate scaling and positioning
-                scale_factor, x_pos, y_pos, scaled_width, scaled_height = self._calculate_scaling_and_position(
-                    img_width, img_height
-                )
-
-                # Fill the entire page with white background
-                canvas_obj.setFillColorRGB(1, 1, 1)  # White color
-                canvas_obj.rect(0, 0, self.page_width, self.page_height, fill=1)
-
-                # Save page image to temporary file
-                with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as temp_file:
-                    img.save(temp_file.name, "JPEG", quality=95)
-                    temp_image_path = temp_file.name
-
-                try:
-                    # Add the scaled and positioned page to the canvas
-                    canvas_obj.drawImage(
-                        temp_image_path,
-                        x_pos,
-                        y_pos,
-                        width=scaled_width,
-                        height=scaled_height,
-                        preserveAspectRatio=True,
-                    )
-
-                    # Move to next page after adding content
-                    canvas_obj.showPage()
-                    print(f"    Added page {page_num} from PDF " f"(scaled by {scale_factor:.2f})")
-
-                finally:
-                    # Clean up temporary file
-                    try:
-                        os.unlink(temp_image_path)
-                    except OSError:
-                        pass
-
-            print(f"  Successfully processed {len(images)} pages from PDF")
+            print(f"  Successfully processed {len(image_paths)} pages from PDF")
             return True
 
         except Exception as e:
@@ -272,12 +469,60 @@ class PDFMerger:
             print("Note: Make sure Poppler is installed on your system for PDF processing")
             return False
 
-    def merge_files(self, output_pdf_path: str) -> bool:
+    def _add_file_to_pdf(self, writer: PdfWriter, file_path: str, temp_dir: str) -> bool:
+        """
+        Add an image or PDF file to the PDF writer, depending on its extension.
+
+        Args:
+            writer (PdfWriter): pypdf writer collecting the output pages
+            file_path (str): Path to the image or PDF file
+            temp_dir (str): Scratch folder shared by the whole merge
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        file_kind = self._kind(file_path)
+
+        if file_kind == "image":
+            return self._add_image_to_pdf(writer, file_path)
+        elif file_kind == "pdf":
+            return self._add_pdf_to_pdf(writer, file_path, temp_dir)
+        return False
+
+    def _merge_pdfs_only(self, writer: PdfWriter) -> int:
+        """
+        Copy the pages of every queued PDF file into the PDF writer, in this process.
+
+        Used when all queued files are PDFs copied as vector content. Nothing needs rendering then, so worker
+        processes would only add the cost of passing every file between processes.
+
+        Args:
+            writer (PdfWriter): pypdf writer collecting the output pages
+
+        Returns:
+            int: Number of files that were added successfully
+        """
+        successful_files = 0
+
+        for i, pdf_path in enumerate(self.files_to_merge, 1):
+            print(f"\nCopying PDF {i}/{len(self.files_to_merge)}: {os.path.basename(pdf_path)}")
+
+            if self._add_pdf_to_pdf(writer, pdf_path):
+                successful_files += 1
+
+        return successful_files
+
+    def merge_files(self, output_pdf_path: str, num_workers: int = 1) -> bool:
         """
         Merge all added files into a single A4 PDF document.
 
+        With more than one worker, files are rendered in separate processes and stitched together in order.
+        Files with identical contents are rendered once and their pages added at every position they occur.
+        Scripts that do this must call merge_files from under an ``if __name__ == "__main__":`` guard.
+
         Args:
             output_pdf_path (str): Path where the merged PDF will be saved
+            num_workers (int): Number of worker processes used to render files (default: 1)
 
         Returns:
             bool: True if merge was successful, False otherwise
@@ -291,27 +536,66 @@ class PDFMerger:
             print(f"Output PDF: {output_pdf_path}")
             print(f"Files to process: {len(self.files_to_merge)}")
 
-            # Create the PDF canvas
-            pdf_canvas = canvas.Canvas(output_pdf_path, pagesize=A4)
+            # Collect the output pages; PDF pages are copied directly instead of being redrawn
+            writer = PdfWriter()
 
             successful_files = 0
 
-            # Process each file in the order they were added
-            for i, file_path in enumerate(self.files_to_merge, 1):
-                print(f"\nProcessing file {i}/{len(self.files_to_merge)}: {os.path.basename(file_path)}")
-
-                # Determine file type and process accordingly
-                file_extension = os.path.splitext(file_path)[1].lower()
-
-                if file_extension in self.supported_image_formats:
-                    if self._add_image_to_pdf(pdf_canvas, file_path):
-                        successful_files += 1
-                elif file_extension in self.supported_pdf_format:
-                    if self._add_pdf_to_pdf(pdf_canvas, file_path):
-                        successful_files += 1
+            # Vector-copied PDFs need no rendering, so skip the worker processes and ReportLab altogether
+            pdfs_only = not self.rasterize_pdfs and all(
+                self._kind(file_path) == "pdf" for file_path in self.files_to_merge
+            )
 
-            # Save the final PDF
-            pdf_canvas.save()
+            if pdfs_only:
+                successful_files = self._merge_pdfs_only(writer)
+            else:
+                # One scratch folder for the whole merge, removed in a single sweep at the end
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    if num_workers > 1 and len(self.files_to_merge) > 1:
+                        # Stage 1: each file is independent, so render them side by side into per-file PDFs.
+                        # Stage 2: concatenate those in one pypdf pass; map() returns them in the order added.
+                        # Workers do not share the encoded image cache, so repeated files are deduplicated here.
+                        file_keys = [
+                            (self._kind(file_path), _content_digest(file_path)) for file_path in self.files_to_merge
+                        ]
+                        unique_files = {}
+                        for key, file_path in zip(file_keys, self.files_to_merge):
+                            unique_files.setdefault(key, file_path)
+
+                        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                            rendered_paths = executor.map(
+                                _render_file_to_pdf,
+                                repeat(self),
+                                unique_files.values(),
+                                repeat(temp_dir),
+                                range(len(unique_files)),
+                            )
+
+                            # Unique files are in order of first occurrence, so each new key takes the next result
+                            rendered_by_key = {}
+                            for i, (file_path, key) in enumerate(zip(self.files_to_merge, file_keys), 1):
+                                print(f"\nAdding file {i}/{len(self.files_to_merge)}: {os.path.basename(file_path)}")
+
+                                if key not in rendered_by_key:
+                                    rendered_by_key[key] = next(rendered_paths)
+
+                                if rendered_by_key[key] is not None:
+                                    writer.append(rendered_by_key[key])
+                                    successful_files += 1
+                    else:
+                        # Process each file in the order they were added
+                        for i, file_path in enumerate(self.files_to_merge, 1):
+                            print(f"\nProcessing file {i}/{len(self.files_to_merge)}: {os.path.basename(file_path)}")
+
+                            if self._add_file_to_pdf(writer, file_path, temp_dir):
+                                successful_files += 1
+
+            # Store identical objects once, e.g. the same image or font used by several inputs
+            writer.compress_identical_objects()
+
+            # Save the final PDF, streaming it straight to the file
+            with open(output_pdf_path, "wb") as output_file:
+                writer.write_stream(output_file)
 
             print("\n✅ Merge completed successfully!")
             print(f"Successfully processed: {successful_files}/{len(self.files_to_merge)} files")
@@ -323,6 +607,10 @@ class PDFMerger:
             print(f"Error during merge process: {str(e)}")
             return False
 
+        finally:
+            # Do not keep encoded images alive (or ship them to worker processes) after the merge
+            self._prepared_images.clear()
+
     def clear_files(self):
         """Clear the list of files to merge."""
         self.files_to_merge.clear()
@@ -339,8 +627,7 @@ class PDFMerger:
         else:
             print(f"\nFiles in merge queue ({len(self.files_to_merge)}):")
             for i, file_path in enumerate(self.files_to_merge, 1):
-                file_extension = os.path.splitext(file_path)[1].lower()
-                file_type = "Image" if file_extension in self.supported_image_formats else "PDF"
+                file_type = "Image" if self._kind(file_path) == "image" else "PDF"
                 print(f"  {i}. {file_type}: {os.path.basename(file_path)}")
 
     def find_supported_files(self, folder_path: str) -> List[str]:
@@ -353,23 +640,23 @@ class PDFMerger:
         Returns:
             List[str]: List of paths to supported files (case-insensitive extension matching)
         """
-        # Find all files in input folder
-        all_input_files = glob.glob(os.path.join(folder_path, "*.*"))
-
-        # List to store supported files
-        supported_files = []
-
-        # Filter files based on extensions (case-insensitive)
-        supported_extensions = list(self.supported_image_formats) + list(self.supported_pdf_format)
-        for file_path in all_input_files:
-            # Get file extension and convert to lowercase for comparison
-            file_ext = os.path.splitext(file_path)[1].lower()
-            if file_ext in supported_extensions:
-                supported_files.append(file_path)
-
-        return supported_files
-
-    def process_folder(self, input_folder: str = "files_input", output_folder: str = "files_output") -> bool:
+        # One directory scan; DirEntry already knows its name and file type, so no extra stat calls are needed.
+        # Hidden files are skipped, as shell-style globbing would.
+        with os.scandir(folder_path) as entries:
+            return [
+                entry.path
+                for entry in entries
+                if not entry.name.startswith(".")
+                and entry.is_file()
+                and self._kind(entry.name) is not None
+            ]
+
+    def process_folder(
+        self,
+        input_folder: str = "files_input",
+        output_folder: str = "files_output",
+        num_workers: int = min(os.cpu_count() or 1, 4),
+    ) -> bool:
         """
         Process all image and PDF files in the input folder and merge them into a single PDF.
 
@@ -378,6 +665,7 @@ class PDFMerger:
         Args:
             input_folder (str): Path to the folder containing image and PDF files (default: 'files_input')
             output_folder (str): Path to the folder where the merged PDF will be saved (default: 'files_output')
+            num_workers (int): Number of worker processes used to render files (default: up to 4)
 
         Returns:
             bool: True if processing and merge were successful, False otherwise
@@ -422,7 +710,7 @@ class PDFMerger:
 
             # Start merge
             print(f"Processing {len(all_files)} files in alphabetical order")
-            return self.merge_files(output_pdf_path)
+            return self.merge_files(output_pdf_path, num_workers=num_workers)
 
         except Exception as e:
             print(f"Error processing folder {input_folder}: {str(e)}")
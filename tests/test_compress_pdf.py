@@ -0,0 +1,67 @@
+"""
+Regression checks for compress_pdf.
+
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+from compress_pdf import PDFCompressor
+
+
+def _write_stencil_mask_pdf(path):
+    """Write a one-page PDF whose only image is a 200x200 stencil mask (/ImageMask true)"""
+    mask_data = bytes((0xF0 if (row // 20) % 2 else 0x0F) for row in range(200) for _ in range(25))
+    content = b"q 0 0 1 rg 200 0 0 200 50 50 cm /Im1 Do Q"
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 300 300] "
+        b"/Resources << /XObject << /Im1 5 0 R >> >> /Contents 4 0 R >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(content), content),
+        b"<< /Type /XObject /Subtype /Image /Width 200 /Height 200 /ImageMask true /BitsPerComponent 1 "
+        b"/Length %d >>\nstream\n%s\nendstream" % (len(mask_data), mask_data),
+    ]
+
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, obj)
+
+    xref_offset = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    Path(path).write_bytes(pdf)
+
+
+class StencilMaskTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.temp_dir.name)
+        self.input_path = self.folder / "mask.pdf"
+        _write_stencil_mask_pdf(self.input_path)
+        self.compressor = PDFCompressor(self.folder, self.folder / "out")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_pymupdf_leaves_stencil_masks_alone(self):
+        output_path = self.folder / "out.pdf"
+        self.compressor.compress_pdf_pymupdf(self.input_path, output_path, quality=60)
+
+        with fitz.open(output_path) as doc:
+            xref = doc[0].get_images(full=True)[0][0]
+            self.assertEqual(doc.xref_get_key(xref, "ImageMask"), ("bool", "true"))
+            self.assertEqual(doc.xref_get_key(xref, "BitsPerComponent"), ("int", "1"))
+            self.assertEqual(doc.xref_get_key(xref, "ColorSpace")[0], "null")
+            self.assertNotEqual(doc.xref_get_key(xref, "Filter"), ("name", "/DCTDecode"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Regression checks for main.
+
+Run from the repository root with: python -m unittest discover tests
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.annotations import Link
+
+from main import PDFMerger
+
+
+class VectorPdfAnnotationTest(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.folder = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_annotations_move_with_the_page_content(self):
+        # A US Letter page is scaled and centered onto A4, so its link must be transformed the same way
+        input_path = self.folder / "letter.pdf"
+        writer = PdfWriter()
+        writer.add_blank_page(width=612, height=792)
+        writer.add_annotation(0, Link(rect=(72, 712, 300, 742), url="https://example.com"))
+        writer.write(input_path)
+
+        merger = PDFMerger()
+        merger.add_file(str(input_path))
+        output_path = self.folder / "merged.pdf"
+        self.assertTrue(merger.merge_files(str(output_path)))
+
+        scale_factor, x_pos, y_pos, _, _ = merger._calculate_scaling_and_position(612.0, 792.0, upscale=True)
+        expected = [x_pos + 72 * scale_factor, y_pos + 712 * scale_factor]
+        expected += [x_pos + 300 * scale_factor, y_pos + 742 * scale_factor]
+
+        annotations = PdfReader(output_path).pages[0]["/Annots"]
+        self.assertEqual(len(annotations), 1)
+        rect = [float(value) for value in annotations[0].get_object()["/Rect"]]
+        for actual, wanted in zip(rect, expected):
+            self.assertAlmostEqual(actual, wanted, places=2)
+
+
+if __name__ == "__main__":
+    unittest.main()